@@ -25,8 +25,10 @@ from __future__ import annotations
 import abc
 import typing
 import warnings
+from bisect import bisect_right
+from collections import OrderedDict
 from collections.abc import Iterable, Iterator, Sequence
-from itertools import chain, repeat
+from itertools import accumulate, chain, islice, repeat
 
 from urwid.canvas import CanvasCombine, CanvasJoin, CanvasOverlay, CompositeCanvas, SolidCanvas
 from urwid.decoration import (
@@ -72,6 +74,8 @@ class WidgetContainerMixin:
     """
     Mixin class for widget containers implementing common container methods
     """
+    __slots__ = ()
+
     def __getitem__(self, position) -> Widget:
         """
         Container short-cut for self.contents[position][0].base_widget
@@ -94,12 +98,17 @@ class WidgetContainerMixin:
         out = []
         w = self
         while True:
+            # leaf widgets and empty containers have no focus widget,
+            # checking for that avoids raising IndexError at the end
+            focus = w.focus
+            if focus is None:
+                return out
             try:
                 p = w.focus_position
             except IndexError:
                 return out
             out.append(p)
-            w = w.focus.base_widget
+            w = focus.base_widget
 
     def set_focus_path(self, positions):
         """
@@ -131,12 +140,12 @@ class WidgetContainerMixin:
         lowest leaf widget.
         """
         out = []
-        w = self
-        while True:
-            w = w.base_widget.focus
-            if w is None:
-                return out
+        # containers are their own base widget
+        w = self.focus
+        while w is not None:
             out.append(w)
+            w = w.base_widget.focus
+        return out
 
     @property
     @abc.abstractmethod
@@ -162,6 +171,8 @@ class WidgetContainerListContentsMixin:
     Mixin class for widget containers whose positions are indexes into
     a list available as self.contents.
     """
+    __slots__ = ()
+
     def __iter__(self) -> Iterator[int]:
         """
         Return an iterable of positions for this container from first
@@ -174,7 +185,7 @@ class WidgetContainerListContentsMixin:
         Return an iterable of positions for this container from last
         to first.
         """
-        return iter(range(len(self.contents) - 1, -1, -1))
+        return reversed(range(len(self.contents)))
 
     def __len__(self) -> int:
         return len(self.contents)
@@ -253,6 +264,9 @@ class GridFlow(WidgetWrap, WidgetContainerMixin, WidgetContainerListContentsMixi
     contains the same width and it arranges them from left to right and top to
     bottom.
     """
+    # number of display widgets kept for reuse by get_display_widget()
+    _LAYOUT_CACHE_SIZE = 8
+
     def sizing(self):
         return frozenset([FLOW])
 
@@ -273,31 +287,41 @@ class GridFlow(WidgetWrap, WidgetContainerMixin, WidgetContainerListContentsMixi
         :param align: horizontal alignment of cells, one of:
             'left', 'center', 'right', ('relative', percentage 0=left 100=right)
         """
-        self._contents = MonitoredFocusList([(w, (GIVEN, cell_width)) for w in cells])
-        self._contents.set_modified_callback(self._invalidate)
+        options = (GIVEN, cell_width)
+        self._contents = MonitoredFocusList([(w, options) for w in cells])
+        self._contents.set_modified_callback(self._contents_changed)
         self._contents.set_focus_changed_callback(lambda f: self._invalidate())
         self._contents.set_validate_contents_modified(self._contents_modified)
+        self._widget_index = None
         self._cell_width = cell_width
         self.h_sep = h_sep
         self.v_sep = v_sep
         self.align = align
-        self._cache_maxcol = None
-        super().__init__(None)
-        # set self._w to something other than None
-        self.get_display_widget(((h_sep+cell_width)*len(self._contents),))
+        self._layout_cache = OrderedDict()
+        self._display_rows = {}
+        # the display widget is generated on first use, when the width
+        # available is known
+        super().__init__(Divider())
 
-    def _invalidate(self) -> None:
-        self._cache_maxcol = None
-        super()._invalidate()
+    def selectable(self) -> bool:
+        """Return True if any of the cells is selectable."""
+        return any(w.selectable() for w, o in self._contents)
+
+    def pack(self, size: tuple[int], focus: bool = False) -> tuple[int, int]:
+        return Widget.pack(self, size, focus)
+
+    def _contents_changed(self) -> None:
+        self._widget_index = None
+        self._invalidate()
 
     def _contents_modified(self, slc, new_items):
-        for item in new_items:
-            try:
+        try:
+            for item in new_items:
                 w, (t, n) = item
                 if t != GIVEN:
                     raise ValueError
-            except (TypeError, ValueError):
-                raise GridFlowError(f"added content invalid {item!r}")
+        except (TypeError, ValueError):
+            raise GridFlowError(f"added content invalid {item!r}")
 
     @property
     def cells(self):
@@ -314,7 +338,7 @@ class GridFlow(WidgetWrap, WidgetContainerMixin, WidgetContainerListContentsMixi
             PendingDeprecationWarning,
             stacklevel=2
         )
-        ml = MonitoredList(w for w, t in self.contents)
+        ml = MonitoredList([w for w, t in self._contents])
 
         def user_modified():
             self.cells = ml
@@ -330,8 +354,8 @@ class GridFlow(WidgetWrap, WidgetContainerMixin, WidgetContainerListContentsMixi
             stacklevel=2
         )
         focus_position = self.focus_position
-        self.contents = [
-            (new, (GIVEN, self._cell_width)) for new in widgets]
+        options = (GIVEN, self._cell_width)
+        self.contents = [(new, options) for new in widgets]
         if focus_position < len(widgets):
             self.focus_position = focus_position
 
@@ -363,9 +387,11 @@ class GridFlow(WidgetWrap, WidgetContainerMixin, WidgetContainerListContentsMixi
 
     @cell_width.setter
     def cell_width(self, width: int) -> None:
+        if width == self._cell_width and all(options[1] == width for w, options in self._contents):
+            return
         focus_position = self.focus_position
-        self.contents = [
-            (w, (GIVEN, width)) for (w, options) in self.contents]
+        new_options = (GIVEN, width)
+        self.contents = [(w, new_options) for (w, options) in self.contents]
         self.focus_position = focus_position
         self._cell_width = width
 
@@ -488,11 +514,15 @@ class GridFlow(WidgetWrap, WidgetContainerMixin, WidgetContainerListContentsMixi
             PendingDeprecationWarning,
             stacklevel=2,
         )
-        for i, (w, options) in enumerate(self.contents):
-            if cell == w:
-                self.focus_position = i
-                return
-        raise ValueError(f"Widget not found in GridFlow contents: {cell!r}")
+        if self._widget_index is None:
+            # map each widget to its first position
+            self._widget_index = index = {}
+            for i, (w, options) in enumerate(self._contents):
+                index.setdefault(id(w), i)
+        try:
+            self.focus_position = self._widget_index[id(cell)]
+        except KeyError:
+            raise ValueError(f"Widget not found in GridFlow contents: {cell!r}") from None
 
     def _set_focus_cell(self, cell: Widget) -> None:
         warnings.warn(
@@ -535,14 +565,33 @@ class GridFlow(WidgetWrap, WidgetContainerMixin, WidgetContainerListContentsMixi
         widget.
         """
         (maxcol,) = size
-        # use cache if possible
-        if self._cache_maxcol == maxcol:
-            return self._w
-
-        self._cache_maxcol = maxcol
-        self._w = self.generate_display_widget(size)
+        # display widgets are reused as long as everything they were
+        # generated from is unchanged.  Widgets are compared by identity,
+        # the cached display widgets keep them alive so ids can't be reused.
+        # Cells may become (un)selectable without notifying us, and the
+        # Piles and Columns built for them depend on it, so it is checked
+        # every time.
+        key = (
+            maxcol,
+            tuple((id(w), width_amount, w.selectable()) for w, (width_type, width_amount) in self._contents),
+            self.h_sep,
+            self.v_sep,
+            self.align,
+            self._contents.focus,
+        )
+        cache = self._layout_cache
+        w = cache.get(key)
+        if w is None:
+            w = self.generate_display_widget(size)
+            cache[key] = w
+            if len(cache) > self._LAYOUT_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
 
-        return self._w
+        if w is not self._w:
+            self._w = w
+        return w
 
     def generate_display_widget(self, size: tuple[int]) -> Divider | Pile:
         """
@@ -553,43 +602,82 @@ class GridFlow(WidgetWrap, WidgetContainerMixin, WidgetContainerListContentsMixi
         if not self.contents:
             return divider
 
-        if self.v_sep > 1:
+        h_sep = self.h_sep
+        v_sep = self.v_sep
+        align = self.align
+        focus_position = self._contents.focus
+
+        if v_sep > 1:
             # increase size of divider
-            divider.top = self.v_sep-1
+            divider.top = v_sep-1
 
-        c = None
-        p = Pile([])
+        # pack the cells into rows of
+        # (first position, [(widget, width, selectable), ...])
+        rows = []
+        cells = None
         used_space = 0
+        for i, (w, (width_type, width_amount)) in enumerate(self._contents):
+            if cells is None or maxcol - used_space < width_amount:
+                cells = []
+                rows.append((i, cells))
+                used_space = 0
+            cells.append((w, width_amount, w.selectable()))
+            used_space += width_amount + h_sep
 
-        for i, (w, (width_type, width_amount)) in enumerate(self.contents):
-            if c is None or maxcol - used_space < width_amount:
-                # starting a new row
-                if self.v_sep:
-                    p.contents.append((divider, p.options()))
-                c = Columns([], self.h_sep)
-                column_focused = False
-                pad = Padding(c, self.align)
+        p = Pile([])
+        pile_options = p.options()
+        # Columns options tuples by width, cells usually share one width
+        column_options = {}
+        row_cache = {}
+
+        for first_position, cells in rows:
+            if first_position <= focus_position < first_position + len(cells):
+                column_focus = focus_position - first_position
+            else:
+                column_focus = next((j for j, (w, width_amount, selectable) in enumerate(cells) if selectable), None)
+            # a single cell wider than the display is not wrapped in Columns
+            too_narrow = cells[0][1] > maxcol
+
+            # rows are reused from the previous generation when they
+            # would be built from exactly the same cells
+            signature = (
+                first_position,
+                tuple((id(w), width_amount, selectable) for w, width_amount, selectable in cells),
+                column_focus,
+                too_narrow,
+                h_sep,
+                align,
+            )
+            pad = self._display_rows.get(signature)
+            if pad is None:
+                c = Columns([], h_sep)
+                for w, width_amount, selectable in cells:
+                    options = column_options.get(width_amount)
+                    if options is None:
+                        options = column_options[width_amount] = c.options(GIVEN, width_amount)
+                    c.contents.append((w, options))
+                if column_focus is not None:
+                    c.focus_position = column_focus
+                pad = Padding(c, align)
                 # extra attribute to reference contents position
-                pad.first_position = i
-                p.contents.append((pad, p.options()))
-
-            c.contents.append((w, c.options(GIVEN, width_amount)))
-            if ((i == self.focus_position) or
-                (not column_focused and w.selectable())):
-                c.focus_position = len(c.contents) - 1
-                column_focused = True
-            if i == self.focus_position:
+                pad.first_position = first_position
+                if too_narrow:
+                    # special case: display is too narrow for the given
+                    # width so we remove the Columns for better behaviour
+                    # FIXME: determine why this is necessary
+                    pad.original_widget = cells[0][0]
+                pad.width = sum(width_amount for w, width_amount, selectable in cells) + h_sep * (len(cells) - 1)
+            row_cache[signature] = pad
+
+            if v_sep:
+                p.contents.append((divider, pile_options))
+            p.contents.append((pad, pile_options))
+            if column_focus is not None and first_position + column_focus == focus_position:
                 p.focus_position = len(p.contents) - 1
-            used_space = (sum(x[1][1] for x in c.contents) +
-                self.h_sep * len(c.contents))
-            if width_amount > maxcol:
-                # special case: display is too narrow for the given
-                # width so we remove the Columns for better behaviour
-                # FIXME: determine why this is necessary
-                pad.original_widget=w
-            pad.width = used_space - self.h_sep
-
-        if self.v_sep:
+
+        self._display_rows = row_cache
+
+        if v_sep:
             # remove first divider
             del p.contents[:1]
         else:
@@ -620,7 +708,14 @@ class GridFlow(WidgetWrap, WidgetContainerMixin, WidgetContainerListContentsMixi
         else:
             col_focus_position = 0
         # pad.first_position was set by generate_display_widget() above
-        self.focus_position = pile_focus.first_position + col_focus_position
+        focus_position = pile_focus.first_position + col_focus_position
+        if focus_position != self.focus_position:
+            # the display widget was modified to follow the new focus,
+            # so it and the rows it shares with other cached display
+            # widgets no longer match the layouts they were cached for
+            self._layout_cache.clear()
+            self._display_rows = {}
+            self.focus_position = focus_position
 
     def keypress(self, size: tuple[int], key: str) -> str | None:
         """
@@ -669,6 +764,31 @@ class OverlayError(Exception):
     pass
 
 
+# obsolete Overlay parameters ('fixed ...', n) and the side they apply to
+_OBSOLETE_FIXED_HORIZONTAL = {'fixed left': LEFT, 'fixed right': RIGHT}
+_OBSOLETE_FIXED_VERTICAL = {'fixed top': TOP, 'fixed bottom': BOTTOM}
+
+
+class _OverlayContents:
+    """
+    List-like view of the two widgets of an :class:`Overlay`, see :attr:`Overlay.contents`.
+    """
+
+    __slots__ = ('_overlay',)
+
+    def __init__(self, overlay: Overlay) -> None:
+        self._overlay = overlay
+
+    def __len__(self) -> int:
+        return 2
+
+    def __getitem__(self, index: Literal[0, 1]):
+        return self._overlay._contents__getitem__(index)
+
+    def __setitem__(self, index: Literal[0, 1], value) -> None:
+        self._overlay._contents__setitem__(index, value)
+
+
 class Overlay(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
     """
     Overlay contains two box widgets and renders one on top of the other
@@ -745,6 +865,8 @@ class Overlay(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
 
         self.top_w = top_w
         self.bottom_w = bottom_w
+        self._padding_filler_cache = None
+        self._overlay_contents = _OverlayContents(self)
 
         self.set_overlay_parameters(
             align, width, valign, height, min_width, min_height, left, right, top, bottom
@@ -813,34 +935,34 @@ class Overlay(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         """
 
         # convert obsolete parameters 'fixed ...':
-        if isinstance(align, tuple):
-            if align[0] == 'fixed left':
-                left = align[1]
-                align = LEFT
-            elif align[0] == 'fixed right':
-                right = align[1]
-                align = RIGHT
-        if isinstance(width, tuple):
-            if width[0] == 'fixed left':
-                left = width[1]
-                width = RELATIVE_100
-            elif width[0] == 'fixed right':
-                right = width[1]
-                width = RELATIVE_100
-        if isinstance(valign, tuple):
-            if valign[0] == 'fixed top':
-                top = valign[1]
-                valign = TOP
-            elif valign[0] == 'fixed bottom':
-                bottom = valign[1]
-                valign = BOTTOM
-        if isinstance(height, tuple):
-            if height[0] == 'fixed bottom':
-                bottom = height[1]
-                height = RELATIVE_100
-            elif height[0] == 'fixed top':
-                top = height[1]
-                height = RELATIVE_100
+        if isinstance(align, tuple) and align[0] in _OBSOLETE_FIXED_HORIZONTAL:
+            side, amount = align
+            align = _OBSOLETE_FIXED_HORIZONTAL[side]
+            if align == LEFT:
+                left = amount
+            else:
+                right = amount
+        if isinstance(width, tuple) and width[0] in _OBSOLETE_FIXED_HORIZONTAL:
+            side, amount = width
+            width = RELATIVE_100
+            if _OBSOLETE_FIXED_HORIZONTAL[side] == LEFT:
+                left = amount
+            else:
+                right = amount
+        if isinstance(valign, tuple) and valign[0] in _OBSOLETE_FIXED_VERTICAL:
+            side, amount = valign
+            valign = _OBSOLETE_FIXED_VERTICAL[side]
+            if valign == TOP:
+                top = amount
+            else:
+                bottom = amount
+        if isinstance(height, tuple) and height[0] in _OBSOLETE_FIXED_VERTICAL:
+            side, amount = height
+            height = RELATIVE_100
+            if _OBSOLETE_FIXED_VERTICAL[side] == TOP:
+                top = amount
+            else:
+                bottom = amount
 
         if width is None:  # more obsolete values accepted
             width = PACK
@@ -856,14 +978,14 @@ class Overlay(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
             min_height = None
 
         # use container API to set the parameters
-        self.contents[1] = (
+        self._contents__setitem__(1, (
             self.top_w,
             self.options(
                 align_type, align_amount, width_type, width_amount,
                 valign_type, valign_amount, height_type, height_amount,
                 min_width, min_height, left, right, top, bottom
             )
-        )
+        ))
 
     def selectable(self) -> bool:
         """Return selectable from top_w."""
@@ -922,12 +1044,7 @@ class Overlay(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         writing a different value for `bottom_options` raises an
         :exc:`OverlayError`.
         """
-        class OverlayContents:
-            def __len__(inner_self):
-                return 2
-            __getitem__ = self._contents__getitem__
-            __setitem__ = self._contents__setitem__
-        return OverlayContents()
+        return self._overlay_contents
 
     @contents.setter
     def contents(self, new_contents):
@@ -936,17 +1053,22 @@ class Overlay(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         self.contents[0] = new_contents[0]
         self.contents[1] = new_contents[1]
 
+    def _get_top_options(self):
+        # built on every read: the parameters are plain attributes that
+        # applications may assign directly
+        return (
+            self.align_type, self.align_amount,
+            self.width_type, self.width_amount,
+            self.min_width, self.left,
+            self.right, self.valign_type, self.valign_amount,
+            self.height_type, self.height_amount,
+            self.min_height, self.top, self.bottom)
+
     def _contents__getitem__(self, index: Literal[0, 1]):
         if index == 0:
             return (self.bottom_w, self._DEFAULT_BOTTOM_OPTIONS)
         if index == 1:
-            return (self.top_w, (
-                self.align_type, self.align_amount,
-                self.width_type, self.width_amount,
-                self.min_width, self.left,
-                self.right, self.valign_type, self.valign_amount,
-                self.height_type, self.height_amount,
-                self.min_height, self.top, self.bottom))
+            return (self.top_w, self._get_top_options())
         raise IndexError(f"Overlay.contents has no position {index!r}")
 
     def _contents__setitem__(self, index: Literal[0, 1], value):
@@ -955,8 +1077,11 @@ class Overlay(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         except (ValueError, TypeError):
             raise OverlayError(f"added content invalid: {value!r}")
         if index == 0:
-            if value_options != self._DEFAULT_BOTTOM_OPTIONS:
+            # contents[0] hands out the class constant itself, so check identity first
+            if value_options is not self._DEFAULT_BOTTOM_OPTIONS and value_options != self._DEFAULT_BOTTOM_OPTIONS:
                 raise OverlayError(f"bottom_options must be set to {self._DEFAULT_BOTTOM_OPTIONS!r}")
+            if value_w is self.bottom_w:
+                return
             self.bottom_w = value_w
         elif index == 1:
             try:
@@ -975,6 +1100,16 @@ class Overlay(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
                 simplify_valign(valign_type, valign_amount), OverlayError)
             height_type, height_amount = normalize_height(
                 simplify_height(height_type, height_amount), OverlayError)
+            top_options = (
+                align_type, align_amount,
+                width_type, width_amount,
+                min_width, left,
+                right, valign_type, valign_amount,
+                height_type, height_amount,
+                min_height, top, bottom)
+            # the parameters don't exist yet when called from __init__()
+            if hasattr(self, 'align_type') and top_options == self._get_top_options():
+                return
             self.align_type = align_type
             self.align_amount = align_amount
             self.width_type = width_type
@@ -1008,6 +1143,15 @@ class Overlay(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
     def calculate_padding_filler(self, size: tuple[int, int], focus: bool) -> tuple[int, int, int, int]:
         """Return (padding left, right, filler top, bottom)."""
         (maxcol, maxrow) = size
+        # unless top_w is packed the result depends only on size and the
+        # overlay parameters.  The parameters may be assigned directly, so
+        # they are compared too.
+        cacheable = self.width_type != PACK and self.height_type != PACK
+        if cacheable:
+            key = (size, self._get_top_options())
+            if self._padding_filler_cache is not None and self._padding_filler_cache[0] == key:
+                return self._padding_filler_cache[1]
+
         height = None
         if self.width_type == PACK:
             width, height = self.top_w.pack((),focus=focus)
@@ -1042,6 +1186,9 @@ class Overlay(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
                 self.valign_type, self.valign_amount,
                 self.height_type, self.height_amount,
                 self.min_height, self.top, self.bottom)
+
+        if cacheable:
+            self._padding_filler_cache = (key, (left, right, top, bottom))
         return left, right, top, bottom
 
     def top_w_size(self, size, left, right, top, bottom):
@@ -1091,6 +1238,53 @@ class FrameError(Exception):
     pass
 
 
+class _FrameContents:
+    """
+    Dict-like view of the parts of a :class:`Frame`, see :attr:`Frame.contents`.
+    """
+
+    __slots__ = ('_frame',)
+
+    def __init__(self, frame: Frame) -> None:
+        self._frame = frame
+
+    def __len__(self) -> int:
+        return len(self._frame._contents_keys())
+
+    def keys(self) -> list[Literal['header', 'footer', 'body']]:
+        return self._frame._contents_keys()
+
+    def items(self):
+        return [(k, self[k]) for k in self.keys()]
+
+    def values(self):
+        return [self[k] for k in self.keys()]
+
+    def update(self, E=None, **F):
+        setitem = self._frame._contents__setitem__
+        if E:
+            if isinstance(E, dict):
+                for k, v in E.items():
+                    setitem(k, v)
+            elif getattr(E, 'keys', None):
+                for k in E:
+                    setitem(k, E[k])
+            else:
+                for k, v in E:
+                    setitem(k, v)
+        for k, v in F.items():
+            setitem(k, v)
+
+    def __getitem__(self, key: Literal['header', 'footer', 'body']):
+        return self._frame._contents__getitem__(key)
+
+    def __setitem__(self, key: Literal['header', 'footer', 'body'], value) -> None:
+        self._frame._contents__setitem__(key, value)
+
+    def __delitem__(self, key: Literal['header', 'footer', 'body']) -> None:
+        self._frame._contents__delitem__(key)
+
+
 class Frame(Widget, WidgetContainerMixin):
     """
     Frame widget is a box widget with optional header and footer
@@ -1128,6 +1322,10 @@ class Frame(Widget, WidgetContainerMixin):
         self._body = body
         self._footer = footer
         self.focus_part = focus_part
+        self._frame_contents = _FrameContents(self)
+        # Filler wrappers used when the header or footer must be trimmed, built on first use
+        self._header_filler = None
+        self._footer_filler = None
 
     @property
     def header(self) -> Widget | None:
@@ -1135,10 +1333,15 @@ class Frame(Widget, WidgetContainerMixin):
 
     @header.setter
     def header(self, header: Widget | None):
-        self._header = header
+        changed = header is not self._header
+        if changed:
+            self._header = header
+            self._header_filler = None
         if header is None and self.focus_part == 'header':
             self.focus_part = 'body'
-        self._invalidate()
+            changed = True
+        if changed:
+            self._invalidate()
 
     def get_header(self) -> Widget | None:
         warnings.warn(
@@ -1164,6 +1367,8 @@ class Frame(Widget, WidgetContainerMixin):
 
     @body.setter
     def body(self, body: Widget) -> None:
+        if body is self._body:
+            return
         self._body = body
         self._invalidate()
 
@@ -1191,10 +1396,15 @@ class Frame(Widget, WidgetContainerMixin):
 
     @footer.setter
     def footer(self, footer: Widget | None) -> None:
-        self._footer = footer
+        changed = footer is not self._footer
+        if changed:
+            self._footer = footer
+            self._footer_filler = None
         if footer is None and self.focus_part == 'footer':
             self.focus_part = 'body'
-        self._invalidate()
+            changed = True
+        if changed:
+            self._invalidate()
 
     def get_footer(self) -> Widget | None:
         warnings.warn(
@@ -1237,8 +1447,9 @@ class Frame(Widget, WidgetContainerMixin):
             raise IndexError(f'Invalid position for Frame: {part}')
         if (part == 'header' and self._header is None) or (part == 'footer' and self._footer is None):
             raise IndexError(f'This Frame has no {part}')
-        self.focus_part = part
-        self._invalidate()
+        if part != self.focus_part:
+            self.focus_part = part
+            self._invalidate()
 
     def get_focus(self) -> Literal['header', 'footer', 'body']:
         """
@@ -1299,32 +1510,7 @@ class Frame(Widget, WidgetContainerMixin):
         to create the options value is recommended for forwards
         compatibility.
         """
-        class FrameContents:
-            def __len__(inner_self):
-                return len(inner_self.keys())
-
-            def items(inner_self):
-                return [(k, inner_self[k]) for k in inner_self.keys()]
-
-            def values(inner_self):
-                return [inner_self[k] for k in inner_self.keys()]
-
-            def update(inner_self, E=None, **F):
-                if E:
-                    keys = getattr(E, 'keys', None)
-                    if keys:
-                        for k in E:
-                            inner_self[k] = E[k]
-                    else:
-                        for k, v in E:
-                            inner_self[k] = v
-                for k in F:
-                    inner_self[k] = F[k]
-            keys = self._contents_keys
-            __getitem__ = self._contents__getitem__
-            __setitem__ = self._contents__setitem__
-            __delitem__ = self._contents__delitem__
-        return FrameContents()
+        return self._frame_contents
 
     def _contents_keys(self) -> list[Literal['header', 'footer', 'body']]:
         keys = ['body']
@@ -1448,7 +1634,9 @@ class Frame(Widget, WidgetContainerMixin):
 
         head = None
         if htrim and htrim < hrows:
-            head = Filler(self.header, 'top').render(
+            if self._header_filler is None:
+                self._header_filler = Filler(self.header, 'top')
+            head = self._header_filler.render(
                 (maxcol, htrim),
                 focus and self.focus_part == 'header')
         elif htrim:
@@ -1469,7 +1657,9 @@ class Frame(Widget, WidgetContainerMixin):
 
         foot = None
         if ftrim and ftrim < frows:
-            foot = Filler(self.footer, 'bottom').render(
+            if self._footer_filler is None:
+                self._footer_filler = Filler(self.footer, 'bottom')
+            foot = self._footer_filler.render(
                 (maxcol, ftrim),
                 focus and self.focus_part == 'footer')
         elif ftrim:
@@ -1497,6 +1687,9 @@ class Frame(Widget, WidgetContainerMixin):
             return self.footer.keypress((maxcol,),key)
         if self.focus_part != 'body':
             return key
+        # check this before asking the header and footer for their rows
+        if not self.body.selectable():
+            return key
         remaining = maxrow
         if self.header is not None:
             remaining -= self.header.rows((maxcol,))
@@ -1504,8 +1697,6 @@ class Frame(Widget, WidgetContainerMixin):
             remaining -= self.footer.rows((maxcol,))
         if remaining <= 0: return key
 
-        if not self.body.selectable():
-            return key
         return self.body.keypress( (maxcol, remaining), key )
 
     def mouse_event(self, size: tuple[int, int], event, button: int, col: int, row: int, focus: bool) -> bool | None:
@@ -1515,10 +1706,13 @@ class Frame(Widget, WidgetContainerMixin):
         """
         (maxcol, maxrow) = size
         (htrim, ftrim), (hrows, frows) = self.frame_top_bottom((maxcol, maxrow), focus)
+        focus_part = self.focus_part
+        # only a button 1 press can move the focus, to a part that doesn't have it yet
+        press = button == 1 and is_mouse_press(event)
 
         if row < htrim: # within header
-            focus = focus and self.focus_part == 'header'
-            if is_mouse_press(event) and button == 1 and self.header.selectable():
+            focus = focus and focus_part == 'header'
+            if press and focus_part != 'header' and self.header.selectable():
                 self.focus_position = 'header'
             if not hasattr(self.header, 'mouse_event'):
                 return False
@@ -1526,8 +1720,8 @@ class Frame(Widget, WidgetContainerMixin):
                 button, col, row, focus )
 
         if row >= maxrow-ftrim: # within footer
-            focus = focus and self.focus_part == 'footer'
-            if is_mouse_press(event) and button == 1 and self.footer.selectable():
+            focus = focus and focus_part == 'footer'
+            if press and focus_part != 'footer' and self.footer.selectable():
                 self.focus_position = 'footer'
             if not hasattr(self.footer, 'mouse_event'):
                 return False
@@ -1535,10 +1729,9 @@ class Frame(Widget, WidgetContainerMixin):
                 button, col, row-maxrow+ftrim, focus )
 
         # within body
-        focus = focus and self.focus_part == 'body'
-        if is_mouse_press(event) and button==1:
-            if self.body.selectable():
-                self.focus_position = 'body'
+        focus = focus and focus_part == 'body'
+        if press and focus_part != 'body' and self.body.selectable():
+            self.focus_position = 'body'
 
         if not hasattr(self.body, 'mouse_event'):
             return False
@@ -1593,10 +1786,20 @@ class Frame(Widget, WidgetContainerMixin):
             yield 'header'
 
 
+# option type names used by the legacy Pile.item_types and Columns.column_types lists
+_OLD_TYPE_NAMES = {GIVEN: FIXED, PACK: FLOW}
+_NEW_TYPE_NAMES = {FIXED: GIVEN, FLOW: PACK}
+
+
 class PileError(Exception):
     pass
 
 
+# shared options tuples for the most common Pile contents, see Pile.options()
+_PILE_PACK_OPTIONS = (PACK, None)
+_PILE_WEIGHT_OPTIONS = (WEIGHT, 1)
+
+
 class Pile(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
     """
     A pile of widgets stacked vertically from top to bottom
@@ -1629,36 +1832,43 @@ class Pile(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         .. note:: If the Pile is treated as a box widget there must be at least
             one ``'weight'`` tuple in :attr:`widget_list`.
         """
-        self._selectable = False
         super().__init__()
-        self._contents = MonitoredFocusList()
-        self._contents.set_modified_callback(self._contents_modified)
-        self._contents.set_focus_changed_callback(lambda f: self._invalidate())
-        self._contents.set_validate_contents_modified(self._validate_contents_modified)
 
+        contents = []
+        append = contents.append
+        pack_types = (FLOW, PACK)
         for i, original in enumerate(widget_list):
             w = original
             if not isinstance(w, tuple):
-                self.contents.append((w, (WEIGHT, 1)))
-            elif w[0] in (FLOW, PACK):
+                append((w, _PILE_WEIGHT_OPTIONS))
+            elif w[0] in pack_types:
                 f, w = w
-                self.contents.append((w, (PACK, None)))
+                append((w, _PILE_PACK_OPTIONS))
             elif len(w) == 2:
                 height, w = w
-                self.contents.append((w, (GIVEN, height)))
+                append((w, (GIVEN, height)))
             elif w[0] == FIXED: # backwards compatibility
                 _ignore, height, w = w
-                self.contents.append((w, (GIVEN, height)))
+                append((w, (GIVEN, height)))
             elif w[0] == WEIGHT:
                 f, height, w = w
-                self.contents.append((w, (f, height)))
+                append((w, (f, height)))
             else:
                 raise PileError(
                     f"initial widget list item invalid {original!r}")
             if focus_item is None and w.selectable():
                 focus_item = i
 
-        if self.contents and focus_item is not None:
+        # the items built above are always valid, so the contents callbacks
+        # are connected only after the list has been filled
+        self._contents = MonitoredFocusList(contents)
+        self._contents.set_modified_callback(self._contents_modified)
+        self._contents.set_focus_changed_callback(lambda f: self._invalidate())
+        self._contents.set_validate_contents_modified(self._validate_contents_modified)
+        self._selectable = any(w.selectable() for w, o in contents)
+        self._widget_index = None
+
+        if contents and focus_item is not None:
             self.focus = focus_item
 
         self.pref_col = 0
@@ -1669,6 +1879,7 @@ class Pile(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         contents has been changed.
         """
         self._selectable = any(w.selectable() for w, o in self.contents)
+        self._widget_index = None
         self._invalidate()
 
     def _validate_contents_modified(self, slc, new_items):
@@ -1693,7 +1904,7 @@ class Pile(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
             PendingDeprecationWarning,
             stacklevel=2,
         )
-        ml = MonitoredList(w for w, t in self.contents)
+        ml = MonitoredList([w for w, t in self._contents])
 
         def user_modified():
             self.widget_list = ml
@@ -1724,10 +1935,11 @@ class Pile(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
             PendingDeprecationWarning,
             stacklevel=2,
         )
-        ml = MonitoredList(
+        old_type_name = _OLD_TYPE_NAMES.get
+        ml = MonitoredList([
             # return the old item type names
-            ({GIVEN: FIXED, PACK: FLOW}.get(f, f), height)
-            for w, (f, height) in self.contents)
+            (old_type_name(f, f), height)
+            for w, (f, height) in self._contents])
 
         def user_modified():
             self.item_types = ml
@@ -1743,7 +1955,7 @@ class Pile(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         )
         focus_position = self.focus_position
         self.contents = [
-            (w, ({FIXED: GIVEN, FLOW: PACK}.get(new_t, new_t), new_height))
+            (w, (_NEW_TYPE_NAMES.get(new_t, new_t), new_height))
             for ((new_t, new_height), (w, options))
             in zip(item_types, self.contents)]
         if focus_position < len(item_types):
@@ -1797,9 +2009,11 @@ class Pile(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         """
 
         if height_type == PACK:
-            return (PACK, None)
+            return _PILE_PACK_OPTIONS
         if height_type not in (GIVEN, WEIGHT):
             raise PileError(f'invalid height_type: {height_type!r}')
+        if height_type == WEIGHT and height_amount == 1 and type(height_amount) is int:
+            return _PILE_WEIGHT_OPTIONS
         return (height_type, height_amount)
 
     @property
@@ -1824,11 +2038,15 @@ class Pile(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         if isinstance(item, int):
             self.focus_position = item
             return
-        for i, (w, options) in enumerate(self.contents):
-            if item == w:
-                self.focus_position = i
-                return
-        raise ValueError(f"Widget not found in Pile contents: {item!r}")
+        if self._widget_index is None:
+            # map each widget to its first position
+            self._widget_index = index = {}
+            for i, (w, options) in enumerate(self._contents):
+                index.setdefault(id(w), i)
+        try:
+            self.focus_position = self._widget_index[id(item)]
+        except KeyError:
+            raise ValueError(f"Widget not found in Pile contents: {item!r}") from None
 
     def get_focus(self) -> Widget | None:
         """
@@ -1938,22 +2156,25 @@ class Pile(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
             remaining = size[1]
 
         l = []
+        # position of the child that gets the focus, if any
+        focus_position = self.contents.focus if focus else None
 
         if remaining is None:
             # pile is a flow widget
-            for w, (f, height) in self.contents:
+            for i, (w, (f, height)) in enumerate(self.contents):
                 if f == GIVEN:
                     l.append(height)
                 else:
-                    l.append(w.rows((maxcol,), focus=focus and self.focus == w))
+                    l.append(w.rows((maxcol,), focus=i == focus_position))
             return l
 
         # pile is a box widget
         # do an extra pass to calculate rows for each widget
         wtotal = 0
-        for w, (f, height) in self.contents:
+        weighted = []  # (position, weight) of the weighted widgets
+        for i, (w, (f, height)) in enumerate(self.contents):
             if f == PACK:
-                rows = w.rows((maxcol,), focus=focus and self.focus == w)
+                rows = w.rows((maxcol,), focus=i == focus_position)
                 l.append(rows)
                 remaining -= rows
             elif f == GIVEN:
@@ -1961,6 +2182,7 @@ class Pile(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
                 remaining -= height
             elif height:
                 l.append(None)
+                weighted.append((i, height))
                 wtotal += height
             else:
                 l.append(0)  # zero-weighted items treated as ('given', 0)
@@ -1971,27 +2193,34 @@ class Pile(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         if remaining < 0:
             remaining = 0
 
-        for i, (w, (f, height)) in enumerate(self.contents):
-            li = l[i]
-            if li is None:
+        for i, height in weighted:
+            if isinstance(height, int) and isinstance(wtotal, int):
+                # round half up, like the float formula, using integers only
+                rows = (2 * remaining * height + wtotal) // (2 * wtotal)
+            else:
                 rows = int(float(remaining) * height / wtotal + 0.5)
-                l[i] = rows
-                remaining -= rows
-                wtotal -= height
+            l[i] = rows
+            remaining -= rows
+            wtotal -= height
         return l
 
     def render(self, size, focus=False):
         maxcol = size[0]
+        flow_size = (maxcol,)
+        is_flow = len(size) == 1
         item_rows = None
 
         combinelist = []
-        for i, (w, (f, height)) in enumerate(self.contents):
-            item_focus = self.focus == w
+        append = combinelist.append
+        contents = self._contents
+        focus_position = contents.focus
+        for i, (w, (f, height)) in enumerate(contents):
+            item_focus = i == focus_position
             canv = None
             if f == GIVEN:
                 canv = w.render((maxcol, height), focus=focus and item_focus)
-            elif f == PACK or len(size)==1:
-                canv = w.render((maxcol,), focus=focus and item_focus)
+            elif f == PACK or is_flow:
+                canv = w.render(flow_size, focus=focus and item_focus)
             else:
                 if item_rows is None:
                     item_rows = self.get_item_rows(size, focus)
@@ -1999,7 +2228,7 @@ class Pile(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
                 if rows>0:
                     canv = w.render((maxcol, rows), focus=focus and item_focus)
             if canv:
-                combinelist.append((canv, i, item_focus))
+                append((canv, i, item_focus))
         if not combinelist:
             return SolidCanvas(" ", size[0], (size[1:]+(0,))[0])
 
@@ -2038,8 +2267,7 @@ class Pile(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         if i > 0:
             if item_rows is None:
                 item_rows = self.get_item_rows(size, focus=True)
-            for r in item_rows[:i]:
-                y += r
+            y += sum(islice(item_rows, i))
         return x, y
 
     def rows(self, size: tuple[int] | tuple[int, int], focus: bool = False) -> int:
@@ -2059,13 +2287,16 @@ class Pile(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         if self.selectable():
             tsize = self.get_item_size(size, i, True, item_rows)
             key = self.focus.keypress(tsize, key)
-            if self._command_map[key] not in ('cursor up', 'cursor down'):
+            command = self._command_map[key]
+            if command not in ('cursor up', 'cursor down'):
                 return key
+        else:
+            command = self._command_map[key]
 
-        if self._command_map[key] == 'cursor up':
-            candidates = list(range(i-1, -1, -1)) # count backwards to 0
-        else: # self._command_map[key] == 'cursor down'
-            candidates = list(range(i+1, len(self.contents)))
+        if command == 'cursor up':
+            candidates = range(i-1, -1, -1) # count backwards to 0
+        else: # command == 'cursor down'
+            candidates = range(i+1, len(self.contents))
 
         if not item_rows:
             item_rows = self.get_item_rows(size, focus=True)
@@ -2074,18 +2305,18 @@ class Pile(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
             if not self.contents[j][0].selectable():
                 continue
 
-            self._update_pref_col_from_focus(size)
+            self._update_pref_col_from_focus(size, item_rows)
             self.focus_position = j
             if not hasattr(self.focus, 'move_cursor_to_coords'):
                 return
 
             rows = item_rows[j]
-            if self._command_map[key] == 'cursor up':
-                rowlist = list(range(rows-1, -1, -1))
-            else: # self._command_map[key] == 'cursor down'
-                rowlist = list(range(rows))
+            if command == 'cursor up':
+                rowlist = range(rows-1, -1, -1)
+            else: # command == 'cursor down'
+                rowlist = range(rows)
+            tsize = self.get_item_size(size, j, True, item_rows)
             for row in rowlist:
-                tsize = self.get_item_size(size, j, True, item_rows)
                 if self.focus.move_cursor_to_coords(tsize, self.pref_col, row):
                     break
             return
@@ -2093,13 +2324,21 @@ class Pile(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         # nothing to select
         return key
 
-    def _update_pref_col_from_focus(self, size: tuple[int] | tuple[int, int]) -> None:
-        """Update self.pref_col from the focus widget."""
+    def _update_pref_col_from_focus(
+        self,
+        size: tuple[int] | tuple[int, int],
+        item_rows: list[int] | None = None,
+    ) -> None:
+        """Update self.pref_col from the focus widget.
+
+        *item_rows* may be passed in when the caller has already computed it
+        with :meth:`get_item_rows` for the same size and focus.
+        """
 
         if not hasattr(self.focus, 'get_pref_col'):
             return
         i = self.focus_position
-        tsize = self.get_item_size(size, i, True)
+        tsize = self.get_item_size(size, i, True, item_rows)
         pref_col = self.focus.get_pref_col(tsize)
         if pref_col is not None:
             self.pref_col = pref_col
@@ -2110,14 +2349,13 @@ class Pile(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
 
         #FIXME guessing focus==True
         focus = True
-        wrow = 0
         item_rows = self.get_item_rows(size, focus)
-        for i, (r, w) in enumerate(zip(item_rows, (w for (w, options) in self.contents))):
-            if wrow + r > row:
-                break
-            wrow += r
-        else:
+        row_ends = list(accumulate(item_rows))
+        i = bisect_right(row_ends, row)
+        if i == len(row_ends):
             return False
+        wrow = row_ends[i - 1] if i else 0
+        w = self.contents[i][0]
 
         if not w.selectable():
             return False
@@ -2144,17 +2382,15 @@ class Pile(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         Pass the event to the contained widget.
         May change focus on button 1 press.
         """
-        wrow = 0
         item_rows = self.get_item_rows(size, focus)
-        for i, (r, w) in enumerate(zip(item_rows,
-                (w for (w, options) in self.contents))):
-            if wrow + r > row:
-                break
-            wrow += r
-        else:
+        row_ends = list(accumulate(item_rows))
+        i = bisect_right(row_ends, row)
+        if i == len(row_ends):
             return False
+        wrow = row_ends[i - 1] if i else 0
+        w = self.contents[i][0]
 
-        focus = focus and self.focus == w
+        focus = focus and i == self.contents.focus
         if is_mouse_press(event) and button == 1:
             if w.selectable():
                 self.focus_position = i
@@ -2170,6 +2406,11 @@ class ColumnsError(Exception):
     pass
 
 
+# shared options tuples for the most common Columns contents, see Columns.options()
+_COLUMNS_PACK_OPTIONS = (PACK, None, False)
+_COLUMNS_WEIGHT_OPTIONS = (WEIGHT, 1, False)
+
+
 class Columns(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
     """
     Widgets arranged horizontally in columns from left to right
@@ -2217,53 +2458,66 @@ class Columns(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         *box_columns* will be displayed with this calculated number of rows,
         filling the full height.
         """
-        self._selectable = False
         super().__init__()
-        self._contents = MonitoredFocusList()
-        self._contents.set_modified_callback(self._contents_modified)
-        self._contents.set_focus_changed_callback(lambda f: self._invalidate())
-        self._contents.set_validate_contents_modified(self._validate_contents_modified)
 
         box_columns = set(box_columns or ())
 
+        contents = []
+        append = contents.append
+        pack_types = (FLOW, PACK)
         for i, original in enumerate(widget_list):
             w = original
+            is_box = i in box_columns
             if not isinstance(w, tuple):
-                self.contents.append((w, (WEIGHT, 1, i in box_columns)))
-            elif w[0] in (FLOW, PACK): # 'pack' used to be called 'flow'
-                f = PACK
+                append((w, (WEIGHT, 1, True) if is_box else _COLUMNS_WEIGHT_OPTIONS))
+            elif w[0] in pack_types: # 'pack' used to be called 'flow'
                 _ignored, w = w
-                self.contents.append((w, (f, None, i in box_columns)))
+                append((w, (PACK, None, True) if is_box else _COLUMNS_PACK_OPTIONS))
             elif len(w) == 2:
                 width, w = w
-                self.contents.append((w, (GIVEN, width, i in box_columns)))
+                append((w, (GIVEN, width, is_box)))
             elif w[0] == FIXED: # backwards compatibility
-                f = GIVEN
                 _ignored, width, w = w
-                self.contents.append((w, (GIVEN, width, i in box_columns)))
+                append((w, (GIVEN, width, is_box)))
             elif w[0] == WEIGHT:
                 f, width, w = w
-                self.contents.append((w, (f, width, i in box_columns)))
+                append((w, (f, width, is_box)))
             else:
                 raise ColumnsError(
                     f"initial widget list item invalid: {original!r}")
             if focus_column is None and w.selectable():
                 focus_column = i
 
+        # the items built above are always valid, so the contents callbacks
+        # are connected only after the list has been filled
+        self._contents = MonitoredFocusList(contents)
+        self._contents.set_modified_callback(self._contents_modified)
+        self._contents.set_focus_changed_callback(lambda f: self._invalidate())
+        self._contents.set_validate_contents_modified(self._validate_contents_modified)
+        self._selectable = any(w.selectable() for w, o in contents)
+        self._has_pack = any(o[0] == PACK for w, o in contents)
+        self._has_box = any(o[2] for w, o in contents)
+        self._widget_index = None
+
         self.dividechars = dividechars
 
-        if self.contents and focus_column is not None:
+        if contents and focus_column is not None:
             self.focus_position = focus_column
         self.pref_col = None
         self.min_width = min_width
         self._cache_maxcol = None
+        self._cache_focus_position = None
 
     def _contents_modified(self) -> None:
         """
-        Recalculate whether this widget should be selectable whenever the
-        contents has been changed.
+        Recalculate whether this widget should be selectable and whether it
+        has any 'pack' or box columns whenever the contents has been changed.
         """
         self._selectable = any(w.selectable() for w, o in self.contents)
+        self._has_pack = any(o[0] == PACK for w, o in self._contents)
+        self._has_box = any(o[2] for w, o in self._contents)
+        self._widget_index = None
+        self._cache_maxcol = None
         self._invalidate()
 
     def _validate_contents_modified(self, slc, new_items) -> None:
@@ -2288,7 +2542,7 @@ class Columns(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
             PendingDeprecationWarning,
             stacklevel=2
         )
-        ml = MonitoredList(w for w, t in self.contents)
+        ml = MonitoredList([w for w, t in self._contents])
 
         def user_modified():
             self.widget_list = ml
@@ -2326,10 +2580,11 @@ class Columns(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
             PendingDeprecationWarning,
             stacklevel=2,
         )
-        ml = MonitoredList(
+        old_type_name = _OLD_TYPE_NAMES.get
+        ml = MonitoredList([
             # return the old column type names
-            ({GIVEN: FIXED, PACK: FLOW}.get(t, t), n)
-            for w, (t, n, b) in self.contents)
+            (old_type_name(t, t), n)
+            for w, (t, n, b) in self._contents])
 
         def user_modified():
             self.column_types = ml
@@ -2346,7 +2601,7 @@ class Columns(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         )
         focus_position = self.focus_position
         self.contents = [
-            (w, ({FIXED: GIVEN, FLOW: PACK}.get(new_t, new_t), new_n, b))
+            (w, (_NEW_TYPE_NAMES.get(new_t, new_t), new_n, b))
             for ((new_t, new_n), (w, (t, n, b)))
             in zip(column_types, self.contents)
         ]
@@ -2368,8 +2623,8 @@ class Columns(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
             PendingDeprecationWarning,
             stacklevel=2,
         )
-        ml = MonitoredList(
-            i for i, (w, (t, n, b)) in enumerate(self.contents) if b)
+        ml = MonitoredList([
+            i for i, (w, options) in enumerate(self._contents) if options[2]])
 
         def user_modified():
             self.box_columns = ml
@@ -2443,16 +2698,17 @@ class Columns(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
             widget when the Columns widget itself is treated as a flow widget.
         :type box_widget: bool
         """
+        if box_widget is False:
+            if width_type == PACK:
+                return _COLUMNS_PACK_OPTIONS
+            if width_type == WEIGHT and width_amount == 1 and type(width_amount) is int:
+                return _COLUMNS_WEIGHT_OPTIONS
         if width_type == PACK:
             width_amount = None
         if width_type not in (PACK, GIVEN, WEIGHT):
             raise ColumnsError(f'invalid width_type: {width_type!r}')
         return (width_type, width_amount, box_widget)
 
-    def _invalidate(self) -> None:
-        self._cache_maxcol = None
-        super()._invalidate()
-
     def set_focus_column(self, num: int) -> None:
         """
         Set the column in focus by its index in :attr:`widget_list`.
@@ -2503,11 +2759,15 @@ class Columns(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         if isinstance(item, int):
             self.focus_position = item
             return
-        for i, (w, options) in enumerate(self.contents):
-            if item == w:
-                self.focus_position = i
-                return
-        raise ValueError(f"Widget not found in Columns contents: {item!r}")
+        if self._widget_index is None:
+            # map each widget to its first position
+            self._widget_index = index = {}
+            for i, (w, options) in enumerate(self._contents):
+                index.setdefault(id(w), i)
+        try:
+            self.focus_position = self._widget_index[id(item)]
+        except KeyError:
+            raise ValueError(f"Widget not found in Columns contents: {item!r}") from None
 
     @property
     def focus(self) -> Widget | None:
@@ -2543,9 +2803,9 @@ class Columns(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         index of child widget in focus.
         Raises :exc:`IndexError` if read when Columns is empty, or when set to an invalid index.
         """
-        if not self.widget_list:
+        if not self._contents:
             raise IndexError("No focus_position, Columns is empty")
-        return self.contents.focus
+        return self._contents.focus
 
     @focus_position.setter
     def focus_position(self, position: int) -> None:
@@ -2595,13 +2855,37 @@ class Columns(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         0 values in the list mean hide corresponding column completely
         """
         maxcol = size[0]
-        # FIXME: get rid of this check and recalculate only when
-        # a 'pack' widget has been modified.
-        if maxcol == self._cache_maxcol and not any(
-                t == PACK for w, (t, n, b) in self.contents):
+        # The cache is cleared when the contents change.  dividechars and
+        # min_width may be assigned directly so they are compared here, and
+        # the focus position only matters when some columns didn't fit.
+        # FIXME: recalculate 'pack' widths only when a 'pack' widget has
+        # been modified.
+        if maxcol == self._cache_maxcol and not self._has_pack and (
+            self._cache_spacing == (self.dividechars, self.min_width)
+        ) and (
+            self._cache_focus_position is None or self._cache_focus_position == self.focus_position
+        ):
             return self._cache_column_widths
 
+        if len(self.contents) == 1:
+            # a single column doesn't share space with any other column
+            w, (t, width, b) = self.contents[0]
+            if t == GIVEN:
+                static_w = width
+            elif t == PACK:
+                static_w = w.pack((maxcol,), focus)[0]
+            else:
+                # weighted columns take all the space if they fit
+                static_w = maxcol if maxcol >= self.min_width else self.min_width
+            widths = [static_w if static_w <= maxcol else 0]
+            self._cache_maxcol = maxcol
+            self._cache_spacing = (self.dividechars, self.min_width)
+            self._cache_column_widths = widths
+            self._cache_focus_position = None
+            return widths
+
         widths = []
+        focus_dependent = False
 
         weighted = []
         shared = maxcol + self.dividechars
@@ -2617,6 +2901,7 @@ class Columns(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
                 static_w = self.min_width
 
             if shared < static_w + self.dividechars and i > self.focus_position:
+                focus_dependent = True
                 break
 
             widths.append(static_w)
@@ -2625,6 +2910,8 @@ class Columns(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
                 weighted.append((width, i))
 
         # drop columns on the left until we fit
+        if shared < 0:
+            focus_dependent = True
         for i, w in enumerate(widths):
             if shared >= 0:
                 break
@@ -2639,14 +2926,22 @@ class Columns(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
             wtotal = sum(weight for weight, i in weighted)
             grow = shared + len(weighted) * self.min_width
             for weight, i in weighted:
-                width = int(float(grow) * weight / wtotal + 0.5)
-                width = max(self.min_width, width)
+                if isinstance(weight, int) and isinstance(wtotal, int):
+                    # round half up, like the float formula, using integers only
+                    width = (2 * grow * weight + wtotal) // (2 * wtotal)
+                else:
+                    width = int(float(grow) * weight / wtotal + 0.5)
+                if width < self.min_width:
+                    width = self.min_width
                 widths[i] = width
                 grow -= width
                 wtotal -= weight
 
         self._cache_maxcol = maxcol
+        self._cache_spacing = (self.dividechars, self.min_width)
         self._cache_column_widths = widths
+        # columns that all fit are laid out the same wherever the focus is
+        self._cache_focus_position = self.focus_position if focus_dependent else None
         return widths
 
     def render(self, size: tuple[int] | tuple[int, int], focus: bool = False) -> SolidCanvas | CompositeCanvas:
@@ -2658,20 +2953,25 @@ class Columns(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         :type focus: bool
         """
         widths = self.column_widths(size, focus)
+        contents = self._contents
+        focus_position = contents.focus
 
         box_maxrow = None
-        if len(size) == 1:
+        if len(size) == 1 and self._has_box:
             box_maxrow = 1
             # two-pass mode to determine maxrow for box columns
-            for i, (mc, (w, (t, n, b))) in enumerate(zip(widths, self.contents)):
+            for i, (mc, (w, (t, n, b))) in enumerate(zip(widths, contents)):
                 if b:
                     continue
                 rows = w.rows((mc,),
-                    focus = focus and self.focus_position == i)
+                    focus = focus and focus_position == i)
                 box_maxrow = max(box_maxrow, rows)
 
         l = []
-        for i, (mc, (w, (t, n, b))) in enumerate(zip(widths, self.contents)):
+        append = l.append
+        last = len(widths) - 1
+        dividechars = self.dividechars
+        for i, (mc, (w, (t, n, b))) in enumerate(zip(widths, contents)):
             # if the widget has a width of 0, hide it
             if mc <= 0:
                 continue
@@ -2681,11 +2981,11 @@ class Columns(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
             else:
                 sub_size = (mc,) + size[1:]
 
-            canv = w.render(sub_size, focus=focus and self.focus_position == i)
+            canv = w.render(sub_size, focus=focus and focus_position == i)
 
-            if i < len(widths) - 1:
-                mc += self.dividechars
-            l.append((canv, i, self.focus_position == i, mc))
+            if i < last:
+                mc += dividechars
+            append((canv, i, focus_position == i, mc))
 
         if not l:
             return SolidCanvas(" ", size[0], (size[1:]+(1,))[0])
@@ -2716,8 +3016,8 @@ class Columns(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         if coords is None:
             return None
         x, y = coords
-        x += sum([self.dividechars + wc
-            for wc in widths[:self.focus_position] if wc > 0])
+        # hidden (zero width) columns take no divider either
+        x += sum(self.dividechars + wc for wc in islice(widths, self.focus_position) if wc > 0)
         return x, y
 
     def move_cursor_to_coords(self, size: tuple[int] | tuple[int, int], col: int, row: int) -> bool:
@@ -2782,52 +3082,53 @@ class Columns(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         """
         widths = self.column_widths(size)
 
-        x = 0
-        for i, (width, (w, (t, n, b))) in enumerate(zip(widths, self.contents)):
-            if col < x:
-                return False
-            w = self.contents[i][0]
-            end = x + width
-
-            if col >= end:
-                x = end + self.dividechars
-                continue
+        # screen column where each column starts
+        dividechars = self.dividechars
+        starts = list(accumulate(chain((0,), (width + dividechars for width in widths))))
+        i = bisect_right(starts, col) - 1
+        if i < 0 or i >= len(widths):
+            return False
+        x = starts[i]
+        end = x + widths[i]
+        if col >= end:
+            # between columns
+            return False
 
-            focus = focus and self.focus_position == i
-            if is_mouse_press(event) and button == 1 and w.selectable():
-                self.focus_position = i
+        w, (t, n, b) = self.contents[i]
+        focus = focus and self.focus_position == i
+        if is_mouse_press(event) and button == 1 and w.selectable():
+            self.focus_position = i
 
-            if not hasattr(w, 'mouse_event'):
-                return False
+        if not hasattr(w, 'mouse_event'):
+            return False
 
-            if len(size) == 1 and b:
-                return w.mouse_event((end - x, self.rows(size)), event, button, col - x, row, focus)
-            return w.mouse_event((end - x,) + size[1:], event, button, col - x, row, focus)
-        return False
+        if len(size) == 1 and b:
+            return w.mouse_event((end - x, self.rows(size)), event, button, col - x, row, focus)
+        return w.mouse_event((end - x,) + size[1:], event, button, col - x, row, focus)
 
     def get_pref_col(self, size: tuple[int] | tuple[int, int]) -> int:
         """Return the pref col from the column in focus."""
         widths = self.column_widths(size)
 
-        w, (t, n, b) = self.contents[self.focus_position]
-        if len(widths) <= self.focus_position:
+        focus_position = self.focus_position
+        w, (t, n, b) = self.contents[focus_position]
+        if len(widths) <= focus_position:
             return 0
         col = None
-        cwidth = widths[self.focus_position]
+        cwidth = widths[focus_position]
+        # screen column where the focus column starts
+        offset = focus_position * self.dividechars + sum(islice(widths, focus_position))
         if hasattr(w, 'get_pref_col'):
             if len(size) == 1 and b:
                 col = w.get_pref_col((cwidth, self.rows(size)))
             else:
                 col = w.get_pref_col((cwidth,) + size[1:])
             if isinstance(col, int):
-                col += self.focus_position * self.dividechars
-                col += sum(widths[:self.focus_position])
+                col += offset
         if col is None:
             col = self.pref_col
         if col is None and w.selectable():
-            col = cwidth // 2
-            col += self.focus_position * self.dividechars
-            col += sum(widths[:self.focus_position] )
+            col = cwidth // 2 + offset
         return col
 
     def rows(self, size: tuple[int] | tuple[int, int], focus: bool = False) -> int:
@@ -2857,14 +3158,15 @@ class Columns(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         if self.focus_position is None: return key
 
         widths = self.column_widths(size)
-        if self.focus_position >= len(widths):
+        i = self.focus_position
+        if i >= len(widths):
             return key
 
-        i = self.focus_position
+        contents = self._contents
+        command_map = self._command_map
         mc = widths[i]
-        w, (t, n, b) = self.contents[i]
-        if self._command_map[key] not in ('cursor up', 'cursor down',
-            'cursor page up', 'cursor page down'):
+        w, (t, n, b) = contents[i]
+        if command_map[key] not in {'cursor up', 'cursor down', 'cursor page up', 'cursor page down'}:
             self.pref_col = None
         if w.selectable():
             if len(size) == 1 and b:
@@ -2872,16 +3174,17 @@ class Columns(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
             else:
                 key = w.keypress((mc,) + size[1:], key)
 
-        if self._command_map[key] not in ('cursor left', 'cursor right'):
+        command = command_map[key]
+        if command not in {'cursor left', 'cursor right'}:
             return key
 
-        if self._command_map[key] == 'cursor left':
-            candidates = list(range(i-1, -1, -1)) # count backwards to 0
-        else: # key == 'right'
-            candidates = list(range(i+1, len(self.contents)))
+        if command == 'cursor left':
+            candidates = range(i-1, -1, -1) # count backwards to 0
+        else: # command == 'cursor right'
+            candidates = range(i+1, len(contents))
 
         for j in candidates:
-            if not self.contents[j][0].selectable():
+            if not contents[j][0].selectable():
                 continue
 
             self.focus_position = j
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import unittest
+import warnings
 from unittest import mock
 
 import urwid
@@ -61,6 +62,35 @@ class FrameTest(unittest.TestCase):
         self.ftbtest("H full h+5f", 'header', 11, 5, (9, 10),
             True, 10, 0)
 
+    def test_set_unchanged_part(self):
+        f = urwid.Frame(urwid.SolidFill(), urwid.Text('h'), focus_part='header')
+        invalidated = []
+        f._invalidate = lambda: invalidated.append(True)
+        f.body = f.body
+        f.header = f.header
+        f.footer = None
+        f.focus_position = 'header'
+        self.assertEqual(invalidated, [])
+        f.header = None
+        self.assertEqual(f.focus_position, 'body')
+        self.assertEqual(invalidated, [True])
+
+    def test_contents_private_part_assigned(self):
+        f = urwid.Frame(urwid.SolidFill(), urwid.Text('h'))
+        body, footer = urwid.SolidFill('b'), urwid.Text('f')
+        f._body = body
+        f._footer = footer
+        self.assertIs(f.contents['body'][0], body)
+        self.assertIs(f.contents['footer'][0], footer)
+
+    def test_render_trimmed_header_replaced(self):
+        f = urwid.Frame(urwid.SolidFill('b'), urwid.Text('h1\nh2\nh3'), focus_part='header')
+        self.assertEqual(f.render((5, 2), True).text, [b'h1   ', b'h2   '])
+        f.header.set_text('i1\ni2\ni3')
+        self.assertEqual(f.render((5, 2), True).text, [b'i1   ', b'i2   '])
+        f.header = urwid.Text('x1\nx2\nx3')
+        self.assertEqual(f.render((5, 2), True).text, [b'x1   ', b'x2   '])
+
 
 class PileTest(unittest.TestCase):
     def ktest(self, desc, l, focus_item, key,
@@ -139,6 +169,49 @@ class PileTest(unittest.TestCase):
         self.assertEqual(3, len(pile))
         self.assertEqual(3, len(pile.contents))
 
+    def test_item_rows_focus(self):
+        class RowsText(urwid.Text):
+            def rows(self, size, focus=False):
+                return 2 if focus else 1
+        t = RowsText('x')
+        pile = urwid.Pile([t, t, t], focus_item=1)
+        self.assertEqual(pile.get_item_rows((5,), True), [1, 2, 1])
+        self.assertEqual(pile.get_item_rows((5,), False), [1, 1, 1])
+        pile.contents[:] = [(t, ('pack', None)), (urwid.SolidFill(), ('weight', 1))]
+        self.assertEqual(pile.get_item_rows((5, 5), True), [1, 4])
+
+    def test_item_rows_weight(self):
+        f = urwid.SolidFill
+        pile = urwid.Pile([f(), ('weight', 2, f()), ('weight', 2, f())])
+        self.assertEqual(pile.get_item_rows((5, 10), False), [2, 4, 4])
+        self.assertEqual(pile.get_item_rows((5, 7), False), [1, 3, 3])
+        pile = urwid.Pile([('weight', 0.5, f()), ('weight', 1.5, f())])
+        self.assertEqual(pile.get_item_rows((5, 10), False), [3, 7])
+
+    def test_focus_widget(self):
+        a, b = urwid.Edit('a'), urwid.Edit('b')
+        pile = urwid.Pile([a, b, a], focus_item=b)
+        self.assertEqual(pile.focus_position, 1)
+        pile.focus = a
+        self.assertEqual(pile.focus_position, 0)
+        pile.contents.insert(0, (b, pile.options()))
+        pile.focus = a
+        self.assertEqual(pile.focus_position, 1)
+        with self.assertRaises(ValueError):
+            pile.focus = urwid.Edit('c')
+
+    def test_init_contents(self):
+        t, e = urwid.Text('one'), urwid.Edit()
+        pile = urwid.Pile([t, ('pack', e), (2, urwid.SolidFill()), ('weight', 3, t)])
+        self.assertEqual(pile.contents[1:], [
+            (e, ('pack', None)), (pile.contents[2][0], ('given', 2)), (t, ('weight', 3))])
+        self.assertEqual(pile.focus_position, 1)
+        self.assertTrue(pile.selectable())
+        self.assertRaises(urwid.PileError, lambda: pile.contents.append(t))
+        pile.contents[1:2] = []
+        self.assertFalse(pile.selectable())
+        self.assertFalse(urwid.Pile([t, t]).selectable())
+
 
 class ColumnsTest(unittest.TestCase):
     def cwtest(self, desc, l, divide, size, exp, focus_column=0):
@@ -261,6 +334,69 @@ class ColumnsTest(unittest.TestCase):
         self.assertEqual(3, len(columns))
         self.assertEqual(3, len(columns.contents))
 
+    def test_focus_position_no_warning(self):
+        columns = urwid.Columns([urwid.Edit(), urwid.Edit()], focus_column=1)
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            self.assertEqual(columns.focus_position, 1)
+            self.assertEqual(columns.keypress((10,), 'left'), None)
+        self.assertEqual(columns.focus_position, 0)
+
+    def test_column_widths_pack_changed(self):
+        t = urwid.Text('ab')
+        columns = urwid.Columns([urwid.Text('x'), urwid.Text('y')])
+        self.assertEqual(columns.column_widths((10,)), [5, 5])
+        columns.contents.append((t, columns.options('pack')))
+        self.assertEqual(columns.column_widths((10,)), [4, 4, 2])
+        t.set_text('abcd')
+        self.assertEqual(columns.column_widths((10,)), [3, 3, 4])
+
+    def test_column_widths_single(self):
+        t = urwid.Text('abcd')
+        self.assertEqual(urwid.Columns([(4, t)]).column_widths((10,)), [4])
+        self.assertEqual(urwid.Columns([(4, t)]).column_widths((3,)), [0])
+        self.assertEqual(urwid.Columns([('pack', t)]).column_widths((10,)), [4])
+        self.assertEqual(urwid.Columns([t], dividechars=1).column_widths((10,)), [10])
+        self.assertEqual(urwid.Columns([t], min_width=5).column_widths((3,)), [0])
+
+    def test_column_widths_focus_changed(self):
+        columns = urwid.Columns([(4, urwid.Edit()), (4, urwid.Edit()), (4, urwid.Edit())])
+        widths = columns.column_widths((12,))
+        columns.focus_position = 2
+        self.assertIs(columns.column_widths((12,)), widths)
+        columns.focus_position = 0
+        self.assertEqual(columns.column_widths((8,)), [4, 4])
+        columns.focus_position = 2
+        self.assertEqual(columns.column_widths((8,)), [0, 4, 4])
+
+    def test_focus_changed_invalidates(self):
+        invalidated = []
+
+        class CountingColumns(urwid.Columns):
+            def _invalidate(self):
+                invalidated.append(True)
+                super()._invalidate()
+
+        columns = CountingColumns([urwid.Edit(), urwid.Edit()])
+        widths = columns.column_widths((10,))
+        del invalidated[:]
+        columns.focus_position = 1
+        self.assertEqual(invalidated, [True])
+        self.assertIs(columns.column_widths((10,)), widths)
+        columns.dividechars = 2
+        self.assertEqual(columns.column_widths((10,)), [4, 4])
+
+    def test_init_contents(self):
+        t, e, f = urwid.Text('one'), urwid.Edit(), urwid.SolidFill()
+        columns = urwid.Columns([t, ('pack', e), (2, t), ('weight', 3, f)], box_columns=[3])
+        self.assertEqual(columns.contents, [
+            (t, ('weight', 1, False)), (e, ('pack', None, False)), (t, ('given', 2, False)), (f, ('weight', 3, True))])
+        self.assertEqual(columns.focus_position, 1)
+        self.assertTrue(columns.selectable())
+        self.assertRaises(urwid.ColumnsError, lambda: columns.contents.append(t))
+        columns.contents[1:2] = []
+        self.assertFalse(columns.selectable())
+
 
 class OverlayTest(unittest.TestCase):
     def test_old_params(self):
@@ -282,6 +418,17 @@ class OverlayTest(unittest.TestCase):
             urwid.SolidFill('B'),
             'right', 1, 'bottom', 1).get_cursor_coords((2,2)), (1,1))
 
+    def test_padding_filler_parameters_changed(self):
+        ovl = urwid.Overlay(urwid.SolidFill('X'), urwid.SolidFill('O'), 'left', 4, 'top', 2)
+        self.assertEqual(ovl.calculate_padding_filler((10, 5), False), (0, 6, 0, 3))
+        self.assertEqual(ovl.calculate_padding_filler((10, 5), False), (0, 6, 0, 3))
+        ovl.set_overlay_parameters('right', 4, 'bottom', 2)
+        self.assertEqual(ovl.calculate_padding_filler((10, 5), False), (6, 0, 3, 0))
+        self.assertEqual(ovl.calculate_padding_filler((8, 5), False), (4, 0, 3, 0))
+        ovl.width_amount = 6
+        self.assertEqual(ovl.calculate_padding_filler((8, 5), False), (2, 0, 3, 0))
+        self.assertEqual(ovl.render((8, 5)).text[3], b"OOXXXXXX")
+
     def test_length(self):
         ovl = urwid.Overlay(
             urwid.SolidFill('X'),
@@ -294,6 +441,23 @@ class OverlayTest(unittest.TestCase):
         self.assertEqual(2, len(ovl))
         self.assertEqual(2, len(ovl.contents))
 
+    def test_top_options_updated(self):
+        ovl = urwid.Overlay(urwid.SolidFill('X'), urwid.SolidFill('O'), 'left', 4, 'top', 2)
+        self.assertEqual(ovl.contents[1][1][:4], ('left', None, 'given', 4))
+        ovl.set_overlay_parameters('right', 6, 'bottom', 2)
+        self.assertEqual(ovl.contents[1][1][:4], ('right', None, 'given', 6))
+        ovl.contents[1] = (ovl.top_w, ovl.options('center', None, 'given', 3, 'middle', None, 'given', 1))
+        self.assertEqual(ovl.contents[1][1][:4], ('center', None, 'given', 3))
+        self.assertEqual(ovl.contents[1][1][7:11], ('middle', None, 'given', 1))
+
+    def test_top_options_attribute_assigned(self):
+        ovl = urwid.Overlay(urwid.SolidFill('X'), urwid.SolidFill('O'), 'left', 4, 'top', 2)
+        ovl.width_amount = 30
+        self.assertEqual(ovl.contents[1][1][:4], ('left', None, 'given', 30))
+        # setting the options read back must not undo the assignment
+        ovl.contents[1] = ovl.contents[1]
+        self.assertEqual(ovl.width_amount, 30)
+
 
 class GridFlowTest(unittest.TestCase):
     def test_cell_width(self):
@@ -318,6 +482,72 @@ class GridFlowTest(unittest.TestCase):
         self.assertEqual(gf.keypress((20,), "enter"), None)
         call_back.assert_called_with(button)
 
+    def test_selectable_before_render(self):
+        gf = urwid.GridFlow([urwid.Text("A"), urwid.Edit("B")], 5, 1, 0, 'left')
+        self.assertTrue(gf.selectable())
+        self.assertEqual(urwid.Pile([urwid.Text("x"), gf]).focus_position, 1)
+        self.assertFalse(urwid.GridFlow([urwid.Text("A")], 5, 1, 0, 'left').selectable())
+
+    def test_selectable_matches_display_widget(self):
+        inner = urwid.Pile([])
+        gf = urwid.GridFlow([urwid.Text("A"), inner], 5, 1, 0, 'left')
+        self.assertFalse(gf.selectable())
+        self.assertFalse(gf.get_display_widget((20,)).selectable())
+        inner.contents.append((urwid.Edit("x:"), inner.options()))
+        self.assertTrue(gf.selectable())
+        self.assertTrue(gf.get_display_widget((20,)).selectable())
+        del inner.contents[:]
+        self.assertFalse(gf.selectable())
+        self.assertFalse(gf.get_display_widget((20,)).selectable())
+
+    def test_display_widget_cache(self):
+        gf = urwid.GridFlow([urwid.Edit(c) for c in "ABC"], 5, 1, 0, 'left')
+        first = gf.get_display_widget((20,))
+        self.assertIs(gf.get_display_widget((20,)), first)
+        narrow = gf.get_display_widget((6,))
+        self.assertIsNot(narrow, first)
+        self.assertIs(gf.get_display_widget((20,)), first)
+        gf.contents.append((urwid.Edit("D"), gf.options()))
+        self.assertIsNot(gf.get_display_widget((20,)), first)
+
+    def test_display_widget_rows_reused(self):
+        gf = urwid.GridFlow([urwid.Edit(c) for c in "ABCDE"], 5, 1, 0, 'left')
+        first = gf.get_display_widget((12,))
+        gf.contents[3] = (urwid.Edit("Z"), gf.options())
+        second = gf.get_display_widget((12,))
+        self.assertIs(first.contents[0][0], second.contents[0][0])
+        self.assertIsNot(first.contents[1][0], second.contents[1][0])
+        self.assertIs(first.contents[2][0], second.contents[2][0])
+        self.assertEqual(gf.render((12,)).text, [b"A     B     ", b"C     Z     ", b"E           "])
+
+    def test_display_widget_cache_focus_moved(self):
+        gf = urwid.GridFlow([urwid.Edit(c) for c in "ABC"], 5, 1, 0, 'left')
+        gf.render((20,), focus=True)
+        self.assertEqual(gf.keypress((20,), "right"), None)
+        self.assertEqual(gf.focus_position, 1)
+        gf.focus_position = 0
+        self.assertEqual(gf.get_display_widget((20,)).focus.base_widget.focus_position, 0)
+        self.assertEqual(gf.keypress((20,), "right"), None)
+        self.assertEqual(gf.focus_position, 1)
+
+    def test_display_widget_cell_became_selectable(self):
+        inner = urwid.Pile([])
+        gf = urwid.GridFlow([urwid.Text("A"), inner], 5, 1, 0, 'left')
+        gf.focus_position = 1
+        gf.rows((20,))
+        edit = urwid.Edit("x:")
+        inner.contents.append((edit, inner.options()))
+        self.assertEqual(gf.keypress((20,), "q"), None)
+        self.assertEqual(edit.edit_text, "q")
+        self.assertEqual(gf.get_cursor_coords((20,)), (9, 0))
+
+        # rows without the focus cell focus their first selectable cell
+        other = urwid.Pile([])
+        gf = urwid.GridFlow([urwid.Edit("A"), urwid.Text("B"), urwid.Text("C"), other], 5, 1, 0, 'left')
+        gf.rows((12,))
+        other.contents.append((urwid.Edit("x:"), other.options()))
+        self.assertEqual(gf.get_display_widget((12,)).contents[1][0].base_widget.focus_position, 1)
+
     def test_length(self):
         grid = urwid.GridFlow((urwid.Text(c) for c in "ABC"), 1, 0, 0, 'left')
         self.assertEqual(3, len(grid))